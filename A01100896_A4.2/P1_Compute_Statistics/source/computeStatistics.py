@@ -4,9 +4,31 @@
 
 from __future__ import annotations
 
+__version__ = "1.1.0"
+
+import os
 import sys
 import time
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
+
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "common"
+)
+sys.path.insert(0, COMMON_DIR)
+
+# pylint: disable=wrong-import-position
+from exporters import export_rows, render_export_summary  # noqa: E402
+from options import parse_options  # noqa: E402
+from result_cache import ResultCache, open_cache, run_cached  # noqa: E402
+
+EXPORT_COLUMNS = [
+    ("count", "int"),
+    ("mean", "float"),
+    ("median", "float"),
+    ("mode", "str"),
+    ("sd", "float"),
+    ("variance", "float"),
+]
 
 
 def parse_numbers(file_path: str) -> List[float]:
@@ -129,24 +151,69 @@ def render_results(stats: Dict[str, Optional[object]], elapsed: float) -> str:
     return "\n".join(lines)
 
 
+def export_row(stats: Dict[str, Optional[object]]) -> Tuple[object, ...]:
+    """Build the typed export row; missing statistics are null."""
+    mode = stats["mode"]
+    return (
+        int(stats["count"]),
+        stats["mean"],
+        stats["median"],
+        None if mode is None else format_mode(mode),
+        stats["sd"],
+        stats["variance"],
+    )
+
+
+def compute_report(file_path: str) -> str:
+    """Parse a file and render its statistics report."""
+    start = time.perf_counter()
+    stats = compute_statistics(parse_numbers(file_path))
+    return render_results(stats, time.perf_counter() - start)
+
+
 def main(argv: List[str]) -> int:
     """Program entry point."""
-    if len(argv) < 2:
-        print("Usage: python computeStatistics.py fileWithData.txt")
+    positional, options = parse_options(argv[1:])
+    if not positional:
+        print(
+            "Usage: python computeStatistics.py fileWithData.txt "
+            "[--export=results.csv|.jsonl|.parquet] "
+            "[--cache=DIR] [--cache-max-bytes=N] [--cache-stats]"
+        )
         return 1
 
-    file_path = argv[1]
-    start = time.perf_counter()
-    values = parse_numbers(file_path)
-    stats = compute_statistics(values)
-    elapsed = time.perf_counter() - start
-
-    output = render_results(stats, elapsed)
+    file_path = positional[0]
+    export_path = options.get("export")
+    if export_path:
+        start = time.perf_counter()
+        stats = compute_statistics(parse_numbers(file_path))
+        try:
+            exported = export_rows(export_path, EXPORT_COLUMNS, [export_row(stats)])
+        except ValueError as error:
+            print(f"Error: {error}")
+            return 1
+        elapsed = time.perf_counter() - start
+        print(render_export_summary(export_path, exported, elapsed))
+        return 0
+
+    try:
+        cache = open_cache(options)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
+    output = run_cached(
+        cache,
+        lambda: ResultCache.make_key("computeStatistics", __version__, [file_path], options),
+        lambda: compute_report(file_path),
+    )
     print(output)
 
     with open("StatisticsResults.txt", "w", encoding="utf-8") as file_handle:
         file_handle.write(output + "\n")
 
+    if cache is not None and "cache-stats" in options:
+        print(cache.render_stats())
+
     return 0
 
 
@@ -4,28 +4,52 @@
 
 from __future__ import annotations
 
+__version__ = "1.1.0"
+
+import os
 import sys
 import time
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "common"
+)
+sys.path.insert(0, COMMON_DIR)
+
+# pylint: disable=wrong-import-position
+from exporters import export_rows, render_export_summary  # noqa: E402
+from options import parse_options  # noqa: E402
+from result_cache import ResultCache, open_cache, run_cached  # noqa: E402
+
+EXPORT_COLUMNS = [
+    ("item", "int"),
+    ("input", "str"),
+    ("value", "int"),
+    ("bin", "str"),
+    ("hex", "str"),
+]
+
+
+def iter_numbers(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[int]]]:
+    """Yield integers from lines, with None value for invalid entries."""
+    for line_no, raw_line in enumerate(lines, start=1):
+        text = raw_line.strip()
+        if not text:
+            print(f"Line {line_no}: empty line skipped")
+            continue
+        try:
+            value = int(text)
+        except ValueError:
+            print(f"Line {line_no}: invalid value '{text}'")
+            yield text, None
+            continue
+        yield text, value
 
 
 def parse_numbers(file_path: str) -> List[Tuple[str, Optional[int]]]:
     """Read integers from a file, keeping invalid entries with None value."""
-    numbers: List[Tuple[str, Optional[int]]] = []
     with open(file_path, "r", encoding="utf-8") as file_handle:
-        for line_no, raw_line in enumerate(file_handle, start=1):
-            text = raw_line.strip()
-            if not text:
-                print(f"Line {line_no}: empty line skipped")
-                continue
-            try:
-                value = int(text)
-            except ValueError:
-                print(f"Line {line_no}: invalid value '{text}'")
-                numbers.append((text, None))
-                continue
-            numbers.append((text, value))
-    return numbers
+        return list(iter_numbers(file_handle))
 
 
 def to_binary_positive(value: int) -> str:
@@ -91,23 +115,74 @@ def render_results(values: List[Tuple[str, Optional[int]]], elapsed: float, labe
     return "\n".join(lines)
 
 
-def main(argv: List[str]) -> int:
-    """Program entry point."""
-    if len(argv) < 2:
-        print("Usage: python convertNumbers.py fileWithData.txt")
-        return 1
+def iter_export_rows(
+    values: Iterable[Tuple[str, Optional[int]]]
+) -> Iterator[Tuple[int, str, Optional[int], Optional[str], Optional[str]]]:
+    """Yield typed export rows; invalid entries get null value, bin and hex."""
+    for index, (raw_text, value) in enumerate(values, start=1):
+        if value is None:
+            yield index, raw_text, None, None, None
+            continue
+        binary, hexadecimal = convert_value(value)
+        yield index, raw_text, value, binary, hexadecimal
+
+
+def export_file(file_path: str, export_path: str) -> int:
+    """Stream conversions of a file to an export file; return rows written."""
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        rows = iter_export_rows(iter_numbers(file_handle))
+        return export_rows(export_path, EXPORT_COLUMNS, rows)
 
-    file_path = argv[1]
+
+def compute_report(file_path: str) -> str:
+    """Parse a file and render its conversion report."""
     start = time.perf_counter()
     values = parse_numbers(file_path)
-    elapsed = time.perf_counter() - start
+    return render_results(values, time.perf_counter() - start, "INPUT")
+
+
+def main(argv: List[str]) -> int:
+    """Program entry point."""
+    positional, options = parse_options(argv[1:])
+    if not positional:
+        print(
+            "Usage: python convertNumbers.py fileWithData.txt "
+            "[--export=results.csv|.jsonl|.parquet] "
+            "[--cache=DIR] [--cache-max-bytes=N] [--cache-stats]"
+        )
+        return 1
 
-    output = render_results(values, elapsed, "INPUT")
+    file_path = positional[0]
+    export_path = options.get("export")
+    if export_path:
+        start = time.perf_counter()
+        try:
+            exported = export_file(file_path, export_path)
+        except ValueError as error:
+            print(f"Error: {error}")
+            return 1
+        elapsed = time.perf_counter() - start
+        print(render_export_summary(export_path, exported, elapsed))
+        return 0
+
+    try:
+        cache = open_cache(options)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
+    output = run_cached(
+        cache,
+        lambda: ResultCache.make_key("convertNumbers", __version__, [file_path], options),
+        lambda: compute_report(file_path),
+    )
     print(output)
 
     with open("ConvertionResults.txt", "w", encoding="utf-8") as file_handle:
         file_handle.write(output + "\n")
 
+    if cache is not None and "cache-stats" in options:
+        print(cache.render_stats())
+
     return 0
 
 
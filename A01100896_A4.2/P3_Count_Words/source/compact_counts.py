@@ -0,0 +1,123 @@
+"""Memory-compact word counter backed by a byte arena and integer arrays."""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from tokenizers import Tokenizer, iter_word_chunks
+
+EMPTY_SLOT = -1
+INITIAL_SLOTS = 1 << 10
+COUNT_LIMIT = (1 << 64) - 1
+
+
+class CompactCounter:
+    """Count words without keeping one str object per distinct word.
+
+    Each distinct word is stored once as UTF-8 in a contiguous ``bytearray``
+    and identified by an integer id: it spans ``arena[offsets[id]:offsets[id + 1]]``
+    and ``counts[id]`` is its frequency. Lookups go through an open-addressing
+    table of ids, kept at most half full.
+    """
+
+    def __init__(self) -> None:
+        self.arena = bytearray()
+        self.offsets = array("Q", [0])
+        self.counts = array("Q")
+        self._slots = array("q", [EMPTY_SLOT]) * INITIAL_SLOTS
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def _word_bytes(self, word_id: int) -> bytearray:
+        return self.arena[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def word(self, word_id: int) -> str:
+        """Return the word stored under an id."""
+        return self._word_bytes(word_id).decode("utf-8")
+
+    def _find_slot(self, key: bytes) -> int:
+        slots = self._slots
+        mask = len(slots) - 1
+        index = hash(key) & mask
+        while True:
+            word_id = slots[index]
+            if word_id == EMPTY_SLOT or self._word_bytes(word_id) == key:
+                return index
+            index = (index + 1) & mask
+
+    def _grow(self) -> None:
+        self._slots = array("q", [EMPTY_SLOT]) * (len(self._slots) * 2)
+        for word_id in range(len(self.counts)):
+            key = bytes(self._word_bytes(word_id))
+            self._slots[self._find_slot(key)] = word_id
+
+    def add(self, word: str, amount: int = 1) -> int:
+        """Add occurrences of a word and return its id."""
+        key = word.encode("utf-8")
+        # Same probe as _find_slot, inlined because this runs once per word.
+        slots, offsets, arena = self._slots, self.offsets, self.arena
+        mask = len(slots) - 1
+        index = hash(key) & mask
+        word_id = slots[index]
+        while word_id != EMPTY_SLOT:
+            if arena[offsets[word_id]:offsets[word_id + 1]] == key:
+                self.counts[word_id] += amount
+                return word_id
+            index = (index + 1) & mask
+            word_id = slots[index]
+
+        word_id = len(self.counts)
+        self.arena += key
+        self.offsets.append(len(self.arena))
+        self.counts.append(amount)
+        self._slots[index] = word_id
+        if 2 * len(self.counts) > len(self._slots):
+            self._grow()
+        return word_id
+
+    def update(self, words: Iterable[str]) -> None:
+        """Add one occurrence for every word in an iterable."""
+        for word in words:
+            self.add(word)
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """Yield (word, count) pairs in insertion order."""
+        for word_id, count in enumerate(self.counts):
+            yield self.word(word_id), count
+
+    def sorted_ids(self, limit: Optional[int] = None) -> List[int]:
+        """Return ids by frequency desc then word asc, optionally only the first ``limit``.
+
+        Each sort key is one bytes object: the inverted count as a fixed-width
+        big-endian prefix followed by the word's UTF-8 bytes from the arena.
+        Byte order equals code point order, so the ranking matches sort_counts
+        without decoding any word.
+        """
+        counts, offsets, arena = self.counts, self.offsets, self.arena
+
+        def rank_key(word_id: int) -> bytes:
+            prefix = (COUNT_LIMIT - counts[word_id]).to_bytes(8, "big")
+            return prefix + arena[offsets[word_id]:offsets[word_id + 1]]
+
+        if limit is None:
+            return sorted(range(len(counts)), key=rank_key)
+        return heapq.nsmallest(limit, range(len(counts)), key=rank_key)
+
+    def sorted_items(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return ranked (word, count) rows like sort_counts, decoding only those returned."""
+        return [(self.word(word_id), self.counts[word_id]) for word_id in self.sorted_ids(limit)]
+
+
+def count_file_compact(file_path: str, tokenizer: Tokenizer) -> CompactCounter:
+    """Stream words from a file into a CompactCounter without a word list."""
+    counter = CompactCounter()
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for _, words in iter_word_chunks(file_handle, tokenizer):
+            # Pre-aggregate each chunk so repeated words cost one arena lookup.
+            for word, amount in Counter(words).items():
+                counter.add(word, amount)
+    return counter
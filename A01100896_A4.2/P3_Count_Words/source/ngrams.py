@@ -0,0 +1,181 @@
+"""Single-pass n-gram and windowed co-occurrence counting for wordCount."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from compact_counts import CompactCounter
+from tokenizers import Tokenizer, iter_word_runs
+
+ID_BITS = 32
+ID_MASK = (1 << ID_BITS) - 1
+DEFAULT_CANDIDATES = 10_000
+
+
+class ExactCounter:
+    """Exact counts for packed integer keys."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+
+    def add(self, key: int) -> None:
+        """Count one occurrence of a key."""
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def items(self) -> Iterable[Tuple[int, int]]:
+        """Return (key, count) pairs."""
+        return self.counts.items()
+
+
+class SketchCounter:
+    """Approximate counts in a count-min sketch with bounded heavy-hitter keys.
+
+    Estimates never undercount. Only the ``candidates`` keys with the highest
+    estimates are remembered, so memory stays fixed regardless of corpus size.
+    """
+
+    def __init__(self, width: int, depth: int, candidates: int = DEFAULT_CANDIDATES) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("sketch width and depth must be positive integers")
+        self.width = width
+        self.rows = [array("Q", [0]) * width for _ in range(depth)]
+        self.candidates = candidates
+        self.estimates: Dict[int, int] = {}
+        self._floor = 0
+
+    def add(self, key: int) -> None:
+        """Count one occurrence of a key and track it if it is a heavy hitter."""
+        estimate = -1
+        for seed, row in enumerate(self.rows):
+            index = hash((seed, key)) % self.width
+            row[index] += 1
+            if estimate < 0 or row[index] < estimate:
+                estimate = row[index]
+        if key in self.estimates or estimate > self._floor:
+            self.estimates[key] = estimate
+        elif len(self.estimates) < self.candidates:
+            self.estimates[key] = estimate
+        if len(self.estimates) >= 2 * self.candidates:
+            self._prune()
+
+    def _prune(self) -> None:
+        kept = sorted(self.estimates.items(), key=lambda item: -item[1])[:self.candidates]
+        self.estimates = dict(kept)
+        self._floor = kept[-1][1]
+
+    def items(self) -> Iterable[Tuple[int, int]]:
+        """Return (key, estimated count) pairs for tracked keys."""
+        return self.estimates.items()
+
+
+KeyCounter = Union[ExactCounter, SketchCounter]
+
+
+class NgramPipeline:
+    """Count several n-gram orders and co-occurrences from one token stream.
+
+    Words are interned once in a CompactCounter, which also holds the exact
+    unigram counts. Higher orders are keyed by packing word ids into one
+    integer, ``ID_BITS`` bits per word. Co-occurrence counts unordered pairs
+    of words at most ``window - 1`` positions apart. With ``sketch_width`` set,
+    n-grams of order two or more and co-occurrences use count-min sketches.
+
+    N-grams and pairs span line breaks but never a gap in the stream: call
+    ``end_run`` where words were dropped, such as at an invalid token or an
+    empty line, so that "the 42 cat" yields no bigram "the cat".
+    """
+
+    def __init__(
+        self,
+        orders: Sequence[int] = (1, 2),
+        window: int = 0,
+        sketch_width: int = 0,
+        sketch_depth: int = 4,
+    ) -> None:
+        if not orders or min(orders) < 1:
+            raise ValueError("n-gram orders must be positive integers")
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if sketch_width < 0:
+            raise ValueError("sketch width must not be negative")
+        if sketch_depth < 1:
+            raise ValueError("sketch depth must be a positive integer")
+        self.orders = sorted(set(orders))
+        self.window = window
+        self.vocabulary = CompactCounter()
+        self.tables: Dict[int, KeyCounter] = {}
+        for order in self.orders:
+            if order > 1:
+                self.tables[order] = self._new_counter(sketch_width, sketch_depth)
+        self.cooccurrence: KeyCounter = self._new_counter(sketch_width, sketch_depth)
+        self._history: Deque[int] = deque(maxlen=max(self.orders[-1] - 1, window - 1, 0))
+
+    @staticmethod
+    def _new_counter(sketch_width: int, sketch_depth: int) -> KeyCounter:
+        if sketch_width > 0:
+            return SketchCounter(sketch_width, sketch_depth)
+        return ExactCounter()
+
+    def end_run(self) -> None:
+        """Forget recent words so the next word starts new n-grams and pairs."""
+        self._history.clear()
+
+    def feed(self, words: Iterable[str]) -> None:
+        """Consume the next words of the current run."""
+        history = self._history
+        tables = self.tables
+        max_span = self.orders[-1]
+        pair_span = self.window - 1
+        for word in words:
+            word_id = self.vocabulary.add(word)
+            key = word_id
+            for distance, previous in enumerate(reversed(history), start=1):
+                if distance < max_span:
+                    key |= previous << (ID_BITS * distance)
+                    if distance + 1 in tables:
+                        tables[distance + 1].add(key)
+                if distance <= pair_span:
+                    low, high = sorted((previous, word_id))
+                    self.cooccurrence.add((low << ID_BITS) | high)
+            history.append(word_id)
+
+    def _decode(self, key: int, order: int) -> str:
+        words: List[str] = []
+        for _ in range(order):
+            words.append(self.vocabulary.word(key & ID_MASK))
+            key >>= ID_BITS
+        return " ".join(reversed(words))
+
+    def ngram_counts(self, order: int) -> Dict[str, int]:
+        """Return counts for one order with n-grams joined by spaces."""
+        if order == 1:
+            return dict(self.vocabulary.items())
+        return {self._decode(key, order): count for key, count in self.tables[order].items()}
+
+    def cooccurrence_counts(self) -> Dict[str, int]:
+        """Return co-occurrence counts keyed by the word pair joined by a space."""
+        counts: Dict[str, int] = {}
+        for key, count in self.cooccurrence.items():
+            low, high = self.vocabulary.word(key >> ID_BITS), self.vocabulary.word(key & ID_MASK)
+            counts[" ".join(sorted((low, high)))] = count
+        return counts
+
+    def sections(self) -> Iterator[Tuple[str, Dict[str, int]]]:
+        """Yield (section suffix, counts) for every requested order and window."""
+        for order in self.orders:
+            yield f"{order}-grams", self.ngram_counts(order)
+        if self.window > 1:
+            yield f"co-occurrence (window {self.window})", self.cooccurrence_counts()
+
+
+def run_pipeline(file_path: str, tokenizer: Tokenizer, pipeline: NgramPipeline) -> NgramPipeline:
+    """Feed every word of a file through the pipeline in one tokenization pass."""
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for _, runs in iter_word_runs(file_handle, tokenizer):
+            for index, words in enumerate(runs):
+                if index:
+                    pipeline.end_run()
+                pipeline.feed(words)
+    return pipeline
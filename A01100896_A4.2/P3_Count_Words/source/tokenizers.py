@@ -0,0 +1,242 @@
+"""Pluggable tokenizers used by wordCount to split and validate words."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import re
+import sys
+import unicodedata
+from typing import Dict, Iterator, List, Optional, Pattern, Protocol, Tuple
+
+DEFAULT_MODE = "ascii"
+CHUNK_SIZE_HINT = 1 << 16
+
+_ASCII_LETTERS = r"[A-Za-z]+"
+
+
+class LineSource(Protocol):  # pylint: disable=too-few-public-methods
+    """Anything with a text file's ``readlines(hint)``."""
+
+    def readlines(self, hint: int = -1) -> List[str]:
+        """Return the next lines totalling about ``hint`` characters."""
+
+
+def is_mark(ch: str) -> bool:
+    """Return True for combining marks (Unicode category M*)."""
+    return unicodedata.category(ch).startswith("M")
+
+
+def category_classes(prefixes: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    """Return (BMP, astral) regex class ranges of code points per Unicode category prefix.
+
+    Neighbouring categories that share a prefix (Lu next to Ll, say) are merged
+    into one range. The re module compiles a class of BMP code points to a
+    bitmap but scans the ranges of any class that reaches past U+FFFF one by
+    one, so the astral ranges are returned separately.
+    """
+    spans: List[List[List[int]]] = [[] for _ in prefixes]
+    categories = map(unicodedata.category, map(chr, range(sys.maxunicode + 1)))
+    code = 0
+    for category, group in itertools.groupby(categories):
+        size = sum(1 for _ in group)
+        for index, prefix in enumerate(prefixes):
+            if not category.startswith(prefix):
+                continue
+            if spans[index] and spans[index][-1][1] == code - 1:
+                spans[index][-1][1] = code + size - 1
+            else:
+                spans[index].append([code, code + size - 1])
+        code += size
+    return [
+        (class_ranges(ranges, 0, 0xFFFF), class_ranges(ranges, 0x10000, sys.maxunicode))
+        for ranges in spans
+    ]
+
+
+def class_ranges(ranges: List[List[int]], low: int, high: int) -> str:
+    """Render the parts of code point ranges between low and high as class items."""
+    items: List[str] = []
+    for first, last in ranges:
+        first, last = max(first, low), min(last, high)
+        if first == last:
+            items.append(re.escape(chr(first)))
+        elif first < last:
+            items.append(f"{re.escape(chr(first))}-{re.escape(chr(last))}")
+    return "".join(items)
+
+
+@functools.lru_cache(maxsize=None)
+def unicode_word_patterns() -> Tuple[str, str]:
+    """Return (any word, BMP-only word) patterns for the Unicode modes.
+
+    A word is a letter followed by letters or combining marks. Letters are the
+    L* categories, exactly what str.isalpha() accepts, so numeric symbols such
+    as "²" (No) or "Ⅻ" (Nl) are not words. The BMP-only pattern repeats one
+    bitmap class per character and drives the chunk fast path; chunks with
+    astral characters fail it and are checked token by token instead.
+    Building the classes scans every code point, so it happens once, on first use.
+    """
+    (letters, astral_letters), (marks, astral_marks) = category_classes(("L", "M"))
+    letter = rf"(?:[{letters}]|[{astral_letters}])"
+    continuation = rf"(?:[{letters}{marks}]|[{astral_letters}{astral_marks}])"
+    return rf"{letter}{continuation}*", rf"[{letters}][{letters}{marks}]*"
+
+
+def compile_chunk_pattern(word: str) -> Pattern[str]:
+    """Compile a pattern matching text whose lines are all non-empty valid words."""
+    line = rf"[^\S\n]*{word}(?:[^\S\n]+{word})*[^\S\n]*"
+    return re.compile(rf"(?:{line}\n)*(?:{line})?")
+
+
+@functools.lru_cache(maxsize=None)
+def word_patterns(unicode_letters: bool) -> Tuple[Pattern[str], Pattern[str]]:
+    """Return compiled (single word, clean chunk) patterns for a letter set."""
+    if unicode_letters:
+        word, chunk_word = unicode_word_patterns()
+    else:
+        word = chunk_word = _ASCII_LETTERS
+    return re.compile(word), compile_chunk_pattern(chunk_word)
+
+
+def is_unicode_word(token: str) -> bool:
+    """Return True when the token is letters plus combining marks only."""
+    if not token or not token[0].isalpha():
+        return False
+    for ch in token:
+        if not (ch.isalpha() or is_mark(ch)):
+            return False
+    return True
+
+
+def is_edge_punctuation(ch: str) -> bool:
+    """Return True for characters stripped from token edges."""
+    return not (ch.isalnum() or is_mark(ch))
+
+
+def strip_punctuation(token: str) -> str:
+    """Remove leading and trailing punctuation or symbols from a token."""
+    start, end = 0, len(token)
+    while start < end and is_edge_punctuation(token[start]):
+        start += 1
+    while end > start and is_edge_punctuation(token[end - 1]):
+        end -= 1
+    return token[start:end]
+
+
+class Tokenizer:
+    """Split text into valid words and rejected tokens for one mode."""
+
+    def __init__(
+        self,
+        unicode_letters: bool = False,
+        casefold: bool = False,
+        strip_punct: bool = False,
+    ) -> None:
+        self.unicode_letters = unicode_letters
+        self.casefold = casefold
+        self.strip_punct = strip_punct
+
+    def is_word(self, token: str) -> bool:
+        """Return True when a single token is a valid word in this mode."""
+        return word_patterns(self.unicode_letters)[0].fullmatch(token) is not None
+
+    def clean_token(self, token: str) -> Optional[str]:
+        """Return the word a single token is counted as, or None when it is invalid."""
+        word = strip_punctuation(token) if self.strip_punct else token
+        if not self.is_word(word):
+            return None
+        return word.casefold() if self.casefold else word
+
+    def clean_chunk_words(self, text: str) -> Optional[List[str]]:
+        """Return words when the whole chunk matches the fast pattern, else None.
+
+        None means some line is blank, some token is invalid, or, in the Unicode
+        modes, some word has an astral character; the caller then tokenizes
+        line by line.
+        """
+        if self.strip_punct or not word_patterns(self.unicode_letters)[1].fullmatch(text):
+            return None
+        if self.casefold:
+            text = text.casefold()
+        return text.split()
+
+    def tokenize(self, text: str) -> Tuple[List[str], List[str]]:
+        """Return (words, invalid tokens) for a line or multi-line chunk."""
+        clean = self.clean_chunk_words(text)
+        if clean is not None:
+            return clean, []
+
+        words: List[str] = []
+        invalid: List[str] = []
+        for token in text.split():
+            word = self.clean_token(token)
+            if word is None:
+                invalid.append(token)
+            else:
+                words.append(word)
+        return words, invalid
+
+
+TOKENIZERS: Dict[str, Tokenizer] = {
+    "ascii": Tokenizer(),
+    "unicode": Tokenizer(unicode_letters=True),
+    "casefold": Tokenizer(unicode_letters=True, casefold=True),
+    "strip-punct": Tokenizer(unicode_letters=True, strip_punct=True),
+}
+
+
+def get_tokenizer(mode: str = DEFAULT_MODE) -> Tokenizer:
+    """Return the registered tokenizer for a mode name."""
+    try:
+        return TOKENIZERS[mode]
+    except KeyError:
+        names = ", ".join(sorted(TOKENIZERS))
+        raise ValueError(f"unknown tokenizer '{mode}' (choose from {names})") from None
+
+
+def iter_word_runs(
+    file_handle: LineSource,
+    tokenizer: Tokenizer,
+    line_no: int = 0,
+) -> Iterator[Tuple[int, List[List[str]]]]:
+    """Yield (last line number, word runs) per chunk, printing invalid tokens.
+
+    A run is a list of consecutive valid words. Runs continue across line
+    breaks and chunks; an empty line or an invalid token ends the current run,
+    so the first run of a chunk continues the last run of the previous one.
+    """
+    while True:
+        lines = file_handle.readlines(CHUNK_SIZE_HINT)
+        if not lines:
+            break
+        clean = tokenizer.clean_chunk_words("".join(lines))
+        if clean is not None:
+            line_no += len(lines)
+            yield line_no, [clean]
+            continue
+        runs: List[List[str]] = [[]]
+        for raw_line in lines:
+            line_no += 1
+            if raw_line.isspace():
+                print(f"Line {line_no}: empty line skipped")
+                runs.append([])
+                continue
+            for token in raw_line.split():
+                word = tokenizer.clean_token(token)
+                if word is None:
+                    print(f"Line {line_no}: invalid value '{token}'")
+                    runs.append([])
+                else:
+                    runs[-1].append(word)
+        yield line_no, runs
+
+
+def iter_word_chunks(
+    file_handle: LineSource,
+    tokenizer: Tokenizer,
+    line_no: int = 0,
+) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (last line number, words) per chunk, printing invalid tokens."""
+    for last_line, runs in iter_word_runs(file_handle, tokenizer, line_no):
+        yield last_line, runs[0] if len(runs) == 1 else list(itertools.chain.from_iterable(runs))
@@ -4,10 +4,29 @@
 
 from __future__ import annotations
 
+__version__ = "1.1.0"
+
 import os
 import sys
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+COMMON_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "common"
+)
+sys.path.insert(0, COMMON_DIR)
+
+# pylint: disable=wrong-import-position
+from exporters import export_rows, render_export_summary  # noqa: E402
+from options import parse_options  # noqa: E402
+from result_cache import ResultCache, open_cache, run_cached  # noqa: E402
+
+from compact_counts import count_file_compact  # noqa: E402
+from ngrams import NgramPipeline, run_pipeline  # noqa: E402
+from tokenizers import DEFAULT_MODE, Tokenizer, get_tokenizer, iter_word_chunks  # noqa: E402
+from word_index import ingest_file, open_index, query_top  # noqa: E402
+
+EXPORT_COLUMNS = [("label", "str"), ("word", "str"), ("count", "int")]
 
 
 def is_alpha_word(token: str) -> bool:
@@ -20,20 +39,14 @@ def is_alpha_word(token: str) -> bool:
     return True
 
 
-def parse_words(file_path: str) -> List[str]:
+def parse_words(file_path: str, tokenizer: Optional[Tokenizer] = None) -> List[str]:
     """Read words from file, skipping invalid tokens with console errors."""
+    if tokenizer is None:
+        tokenizer = get_tokenizer(DEFAULT_MODE)
     words: List[str] = []
     with open(file_path, "r", encoding="utf-8") as file_handle:
-        for line_no, raw_line in enumerate(file_handle, start=1):
-            line = raw_line.strip()
-            if not line:
-                print(f"Line {line_no}: empty line skipped")
-                continue
-            for token in line.split():
-                if not is_alpha_word(token):
-                    print(f"Line {line_no}: invalid value '{token}'")
-                    continue
-                words.append(token)
+        for _, chunk_words in iter_word_chunks(file_handle, tokenizer):
+            words.extend(chunk_words)
     return words
 
 
@@ -50,34 +63,196 @@ def sort_counts(counts: Dict[str, int]) -> List[Tuple[str, int]]:
     return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
 
 
-def render_results(counts: Dict[str, int], label: str, elapsed: float) -> str:
-    """Render results table for console and file output."""
-    lines = [f"Row Labels\tCount of {label}"]
-    for word, count in sort_counts(counts):
-        lines.append(f"{word}\t{count}")
+def render_sections(
+    sections: List[Tuple[str, List[Tuple[str, int]]]], elapsed: float
+) -> str:
+    """Render one results table per (label, sorted rows) section."""
+    lines: List[str] = []
+    for label, rows in sections:
+        if lines:
+            lines.append("")
+        lines.append(f"Row Labels\tCount of {label}")
+        for word, count in rows:
+            lines.append(f"{word}\t{count}")
     lines.append(f"ELAPSED_SECONDS\t{elapsed:.6f}")
     return "\n".join(lines)
 
 
+def render_rows(rows: List[Tuple[str, int]], label: str, elapsed: float) -> str:
+    """Render already sorted (word, count) rows as the results table."""
+    return render_sections([(label, rows)], elapsed)
+
+
+def render_results(counts: Dict[str, int], label: str, elapsed: float) -> str:
+    """Render results table for console and file output."""
+    return render_rows(sort_counts(counts), label, elapsed)
+
+
+def iter_index_counts(
+    index_path: str,
+    file_paths: List[str],
+    tokenizer_mode: str,
+    top: Optional[int],
+) -> Iterator[Tuple[str, int]]:
+    """Ingest new data from files into the index and stream ranked counts."""
+    tokenizer = get_tokenizer(tokenizer_mode)
+    conn = open_index(index_path, tokenizer_mode)
+    try:
+        for file_path in file_paths:
+            ingest_file(conn, file_path, tokenizer)
+        yield from query_top(conn, top)
+    finally:
+        conn.close()
+
+
+def count_with_index(
+    index_path: str,
+    file_paths: List[str],
+    tokenizer_mode: str,
+    top: Optional[int],
+) -> List[Tuple[str, int]]:
+    """Ingest new data from files into the index and return ranked counts."""
+    return list(iter_index_counts(index_path, file_paths, tokenizer_mode, top))
+
+
+def parse_orders(text: str) -> List[int]:
+    """Parse a comma-separated list of n-gram orders such as "1,2,3"."""
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def parse_top(options: Dict[str, str]) -> Optional[int]:
+    """Return the --top row limit, or None when every row is reported."""
+    if "top" not in options:
+        return None
+    top = int(options["top"])
+    if top < 0:
+        raise ValueError("top must not be negative")
+    return top
+
+
+def build_sections(
+    positional: List[str], options: Dict[str, str]
+) -> List[Tuple[str, List[Tuple[str, int]]]]:
+    """Return (label, ranked rows) report sections for the requested inputs."""
+    mode = options.get("tokenizer", DEFAULT_MODE)
+    tokenizer = get_tokenizer(mode)
+    top = parse_top(options)
+    index_path = options.get("index")
+    if index_path:
+        label = os.path.splitext(os.path.basename(index_path))[0]
+        return [(label, count_with_index(index_path, positional, mode, top))]
+
+    sections: List[Tuple[str, List[Tuple[str, int]]]] = []
+    for file_path in positional:
+        sections.extend(file_sections(file_path, tokenizer, options, top))
+    return sections
+
+
+def file_sections(
+    file_path: str, tokenizer: Tokenizer, options: Dict[str, str], top: Optional[int]
+) -> List[Tuple[str, List[Tuple[str, int]]]]:
+    """Return the report sections for one input file counted on its own."""
+    label = os.path.splitext(os.path.basename(file_path))[0]
+    if "ngrams" in options or "window" in options:
+        pipeline = NgramPipeline(
+            parse_orders(options.get("ngrams", "1")),
+            window=int(options.get("window", "0")),
+            sketch_width=int(options.get("sketch-width", "0")),
+            sketch_depth=int(options.get("sketch-depth", "4")),
+        )
+        run_pipeline(file_path, tokenizer, pipeline)
+        return [
+            (f"{label} {suffix}", sort_counts(counts)[:top])
+            for suffix, counts in pipeline.sections()
+        ]
+    if "compact" in options:
+        return [(label, count_file_compact(file_path, tokenizer).sorted_items(top))]
+    counts = count_words(parse_words(file_path, tokenizer))
+    return [(label, sort_counts(counts)[:top])]
+
+
+def iter_section_rows(
+    sections: List[Tuple[str, List[Tuple[str, int]]]]
+) -> Iterator[Tuple[str, str, int]]:
+    """Flatten report sections into (label, word, count) export rows."""
+    for label, rows in sections:
+        for word, count in rows:
+            yield label, word, count
+
+
+def iter_export_rows(
+    positional: List[str], options: Dict[str, str]
+) -> Iterator[Tuple[str, str, int]]:
+    """Yield (label, word, count) export rows; index counts stream from the cursor."""
+    index_path = options.get("index")
+    if not index_path:
+        yield from iter_section_rows(build_sections(positional, options))
+        return
+    label = os.path.splitext(os.path.basename(index_path))[0]
+    top = parse_top(options)
+    mode = options.get("tokenizer", DEFAULT_MODE)
+    for word, count in iter_index_counts(index_path, positional, mode, top):
+        yield label, word, count
+
+
+def compute_report(positional: List[str], options: Dict[str, str]) -> str:
+    """Count words for the requested inputs and render the report."""
+    start = time.perf_counter()
+    sections = build_sections(positional, options)
+    return render_sections(sections, time.perf_counter() - start)
+
+
 def main(argv: List[str]) -> int:
     """Program entry point."""
-    if len(argv) < 2:
-        print("Usage: python wordCount.py fileWithData.txt")
+    positional, options = parse_options(argv[1:])
+    if not positional and not options.get("index"):
+        print(
+            "Usage: python wordCount.py fileWithData.txt [more.txt ...] "
+            "[--tokenizer=MODE] [--index=words.db] [--top=K] [--compact] "
+            "[--ngrams=1,2,3] [--window=W] [--sketch-width=N] [--sketch-depth=D] "
+            "[--export=results.csv|.jsonl|.parquet] "
+            "[--cache=DIR] [--cache-max-bytes=N] [--cache-stats]"
+        )
         return 1
 
-    file_path = argv[1]
-    label = os.path.splitext(os.path.basename(file_path))[0]
-    start = time.perf_counter()
-    words = parse_words(file_path)
-    counts = count_words(words)
-    elapsed = time.perf_counter() - start
+    export_path = options.get("export")
+    if export_path:
+        start = time.perf_counter()
+        try:
+            rows = iter_export_rows(positional, options)
+            exported = export_rows(export_path, EXPORT_COLUMNS, rows)
+        except ValueError as error:
+            print(f"Error: {error}")
+            return 1
+        elapsed = time.perf_counter() - start
+        print(render_export_summary(export_path, exported, elapsed))
+        return 0
 
-    output = render_results(counts, label, elapsed)
+    try:
+        # Index reports depend on the index state, not just the input files.
+        cache = None if options.get("index") else open_cache(options)
+        output = run_cached(
+            cache,
+            lambda: ResultCache.make_key(
+                "wordCount",
+                __version__,
+                positional,
+                options,
+                [os.path.basename(file_path) for file_path in positional],
+            ),
+            lambda: compute_report(positional, options),
+        )
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
     print(output)
 
     with open("WordCountResults.txt", "w", encoding="utf-8") as file_handle:
         file_handle.write(output + "\n")
 
+    if cache is not None and "cache-stats" in options:
+        print(cache.render_stats())
+
     return 0
 
 
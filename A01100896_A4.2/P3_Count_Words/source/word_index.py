@@ -0,0 +1,137 @@
+"""Persistent SQLite word count index with incremental file ingestion."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from tokenizers import Tokenizer, iter_word_chunks
+
+FLUSH_DISTINCT_WORDS = 100_000
+TAIL_BLOCK_BYTES = 1 << 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS words (
+    word TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS words_by_count ON words (count DESC, word);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    byte_offset INTEGER NOT NULL,
+    line_no INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+UPSERT_WORD = (
+    "INSERT INTO words (word, count) VALUES (?, ?) "
+    "ON CONFLICT (word) DO UPDATE SET count = count + excluded.count"
+)
+
+
+def open_index(index_path: str, tokenizer_mode: str) -> sqlite3.Connection:
+    """Open or create an index, refusing one built with another tokenizer."""
+    conn = sqlite3.connect(index_path)
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'tokenizer'").fetchone()
+    if row is None:
+        with conn:
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('tokenizer', ?)",
+                (tokenizer_mode,),
+            )
+    elif row[0] != tokenizer_mode:
+        conn.close()
+        raise ValueError(
+            f"index '{index_path}' was built with tokenizer '{row[0]}', "
+            f"not '{tokenizer_mode}'"
+        )
+    return conn
+
+
+def flush_counts(conn: sqlite3.Connection, pending: Dict[str, int]) -> None:
+    """Bulk upsert pending counts into the index and clear them."""
+    conn.executemany(UPSERT_WORD, pending.items())
+    pending.clear()
+
+
+class CompleteLineReader:  # pylint: disable=too-few-public-methods
+    """Decode the newline-terminated lines of a binary file up to an end offset."""
+
+    def __init__(self, raw_handle: BinaryIO, end_offset: int) -> None:
+        self.raw_handle = raw_handle
+        self.remaining = end_offset - raw_handle.tell()
+
+    def readlines(self, hint: int = -1) -> List[str]:
+        """Return whole lines totalling about ``hint`` bytes, never past the end offset."""
+        lines: List[str] = []
+        if self.remaining <= 0:
+            return lines
+        # readlines() may return one line past the hint; that is the unread tail
+        for line in self.raw_handle.readlines(min(hint, self.remaining) if hint > 0 else -1):
+            if self.remaining <= 0:
+                break
+            self.remaining -= len(line)
+            lines.append(line.decode("utf-8"))
+        return lines
+
+
+def complete_lines_end(raw_handle: BinaryIO, start: int, size: int) -> int:
+    """Return the offset just past the last newline between start and size, or start."""
+    position = size
+    while position > start:
+        block_start = max(start, position - TAIL_BLOCK_BYTES)
+        raw_handle.seek(block_start)
+        newline = raw_handle.read(position - block_start).rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        position = block_start
+    return start
+
+
+def ingest_file(conn: sqlite3.Connection, file_path: str, tokenizer: Tokenizer) -> int:
+    """Add complete lines appended to a file since its last ingestion; return bytes read.
+
+    Files are treated as append-only. Only lines ending in a newline are read;
+    an unterminated last line is left for the next run, when it may have been
+    completed. Counts and the new offset are committed in one transaction, so
+    an interrupted run never double counts.
+    """
+    path = os.path.abspath(file_path)
+    row = conn.execute(
+        "SELECT byte_offset, line_no FROM sources WHERE path = ?", (path,)
+    ).fetchone()
+    offset, line_no = row if row is not None else (0, 0)
+    size = os.path.getsize(path)
+    if size < offset:
+        raise ValueError(f"'{file_path}' shrank since it was indexed")
+
+    pending: Dict[str, int] = {}
+    with conn, open(path, "rb") as raw_handle:
+        end_offset = complete_lines_end(raw_handle, offset, size)
+        raw_handle.seek(offset)
+        line_reader = CompleteLineReader(raw_handle, end_offset)
+        for line_no, words in iter_word_chunks(line_reader, tokenizer, line_no):
+            for word in words:
+                pending[word] = pending.get(word, 0) + 1
+            if len(pending) >= FLUSH_DISTINCT_WORDS:
+                flush_counts(conn, pending)
+        flush_counts(conn, pending)
+        conn.execute(
+            "INSERT OR REPLACE INTO sources (path, byte_offset, line_no) VALUES (?, ?, ?)",
+            (path, end_offset, line_no),
+        )
+    return end_offset - offset
+
+
+def query_top(conn: sqlite3.Connection, limit: Optional[int] = None) -> Iterator[Tuple[str, int]]:
+    """Iterate counts by frequency desc then word asc, optionally top-K, from the cursor."""
+    sql = "SELECT word, count FROM words ORDER BY count DESC, word ASC"
+    if limit is None:
+        return conn.execute(sql)
+    return conn.execute(sql + " LIMIT ?", (limit,))
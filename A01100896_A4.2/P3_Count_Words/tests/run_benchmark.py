@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark the chunked tokenizers against per-token parsing of the same text."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+SOURCE_DIR = os.path.join(ROOT_DIR, "source")
+
+sys.path.insert(0, SOURCE_DIR)
+
+# pylint: disable=wrong-import-position
+from tokenizers import Tokenizer, get_tokenizer  # noqa: E402
+from wordCount import is_alpha_word, parse_words  # noqa: E402
+
+REPEATS = 5
+CORPUS_COPIES = 40
+TOLERANCE = 1.05
+UNICODE_MODES = ("unicode", "casefold", "strip-punct")
+UNICODE_LINES = 40_000
+UNICODE_POOL = [
+    "hello", "café", "cafe\u0301", "Straße", "naïve", "ΣΊΣΥΦΟΣ", "слово", "हिन्दी",
+    "नमस्ते", "一二", "日本語", "مرحبا", "the", "regulatory", "mother",
+]
+
+
+def legacy_parse_words(file_path: str) -> List[str]:
+    """Parse words exactly as wordCount did before tokenizers existed."""
+    words: List[str] = []
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for line_no, raw_line in enumerate(file_handle, start=1):
+            line = raw_line.strip()
+            if not line:
+                print(f"Line {line_no}: empty line skipped")
+                continue
+            for token in line.split():
+                if not is_alpha_word(token):
+                    print(f"Line {line_no}: invalid value '{token}'")
+                    continue
+                words.append(token)
+    return words
+
+
+def build_corpus(output_path: str) -> None:
+    """Concatenate all test cases several times into one large corpus."""
+    chunks: List[str] = []
+    for name in sorted(os.listdir(SCRIPT_DIR)):
+        if name.startswith("TC") and name.endswith(".txt"):
+            with open(os.path.join(SCRIPT_DIR, name), "r", encoding="utf-8") as file_handle:
+                chunks.append(file_handle.read())
+    with open(output_path, "w", encoding="utf-8") as file_handle:
+        for _ in range(CORPUS_COPIES):
+            for chunk in chunks:
+                file_handle.write(chunk.rstrip("\n") + "\n")
+
+
+def per_token_parse_words(file_path: str, tokenizer: Tokenizer) -> List[str]:
+    """Parse words checking every token on its own, without the chunk fast path."""
+    words: List[str] = []
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for line_no, raw_line in enumerate(file_handle, start=1):
+            if raw_line.isspace():
+                print(f"Line {line_no}: empty line skipped")
+                continue
+            for token in raw_line.split():
+                word = tokenizer.clean_token(token)
+                if word is None:
+                    print(f"Line {line_no}: invalid value '{token}'")
+                    continue
+                words.append(word)
+    return words
+
+
+def build_unicode_corpus(output_path: str) -> None:
+    """Write clean lines of accented, NFD, Greek, Cyrillic, Devanagari, CJK and Arabic words."""
+    rng = random.Random(42)
+    with open(output_path, "w", encoding="utf-8") as file_handle:
+        for _ in range(UNICODE_LINES):
+            file_handle.write(" ".join(rng.choices(UNICODE_POOL, k=8)) + "\n")
+
+
+def compare_mode(mode: str, file_path: str) -> Tuple[float, float, bool]:
+    """Return per-token seconds, chunked seconds and whether both gave the same words."""
+    tokenizer = get_tokenizer(mode)
+    with contextlib.redirect_stdout(io.StringIO()):
+        same_output = per_token_parse_words(file_path, tokenizer) == parse_words(
+            file_path, tokenizer
+        )
+    per_token = best_time(lambda path: per_token_parse_words(path, tokenizer), file_path)
+    chunked = best_time(lambda path: parse_words(path, tokenizer), file_path)
+    return per_token, chunked, same_output
+
+
+def best_time(parser: Callable[[str], List[str]], file_path: str) -> float:
+    """Return the best wall time of several runs with console output muted."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            parser(file_path)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """Compare legacy and tokenizer-based parsing for output and speed."""
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus_path = os.path.join(temp_dir, "corpus.txt")
+        build_corpus(corpus_path)
+        unicode_path = os.path.join(temp_dir, "unicode.txt")
+        build_unicode_corpus(unicode_path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            same_output = legacy_parse_words(corpus_path) == parse_words(corpus_path)
+        legacy = best_time(legacy_parse_words, corpus_path)
+        current = best_time(parse_words, corpus_path)
+        if not same_output or current > legacy * TOLERANCE:
+            failures.append("ASCII tokenizer regressed against the legacy parser.")
+        print(f"LEGACY_SECONDS\t{legacy:.6f}")
+        print(f"ASCII_TOKENIZER_SECONDS\t{current:.6f}")
+        print(f"SPEEDUP\t{legacy / current:.2f}")
+        print(f"SAME_OUTPUT\t{same_output}")
+
+        print("MODE\tPER_TOKEN_SECONDS\tCHUNKED_SECONDS\tSPEEDUP\tSAME_OUTPUT")
+        for mode in UNICODE_MODES:
+            per_token, chunked, mode_same = compare_mode(mode, unicode_path)
+            speedup = per_token / chunked
+            print(f"{mode}\t{per_token:.6f}\t{chunked:.6f}\t{speedup:.2f}\t{mode_same}")
+            # strip-punct has no chunk fast path, so only its output is checked.
+            has_fast_path = not get_tokenizer(mode).strip_punct
+            if not mode_same or (has_fast_path and chunked > per_token * TOLERANCE):
+                failures.append(f"{mode} tokenizer is slower than per-token parsing.")
+
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare peak memory and time of dict counting against the compact counter."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+SOURCE_DIR = os.path.join(ROOT_DIR, "source")
+
+sys.path.insert(0, SOURCE_DIR)
+
+# pylint: disable=wrong-import-position
+from compact_counts import count_file_compact  # noqa: E402
+from tokenizers import get_tokenizer, iter_word_chunks  # noqa: E402
+from wordCount import sort_counts  # noqa: E402
+
+DISTINCT_WORDS = 100_000
+TOTAL_TOKENS = 1_000_000
+WORDS_PER_LINE = 10
+TOP_K = 100
+SEED = 42
+
+T = TypeVar("T")
+
+
+def build_corpus(output_path: str) -> None:
+    """Write a Zipf-like corpus with many distinct ASCII words."""
+    rng = random.Random(SEED)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+        for _ in range(DISTINCT_WORDS)
+    ]
+    weights = [1.0 / rank for rank in range(1, DISTINCT_WORDS + 1)]
+    tokens = vocabulary + rng.choices(vocabulary, weights, k=TOTAL_TOKENS - DISTINCT_WORDS)
+    rng.shuffle(tokens)
+    with open(output_path, "w", encoding="utf-8") as file_handle:
+        for start in range(0, len(tokens), WORDS_PER_LINE):
+            file_handle.write(" ".join(tokens[start:start + WORDS_PER_LINE]) + "\n")
+
+
+def dict_ranking(file_path: str, top: Optional[int]) -> List[Tuple[str, int]]:
+    """Rank words counted into a dict fed from the same word stream."""
+    counts: Dict[str, int] = {}
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for _, words in iter_word_chunks(file_handle, get_tokenizer()):
+            for word in words:
+                counts[word] = counts.get(word, 0) + 1
+    return sort_counts(counts)[:top]
+
+
+def compact_ranking(file_path: str, top: Optional[int]) -> List[Tuple[str, int]]:
+    """Rank words with the streaming compact counter, as --compact does."""
+    return count_file_compact(file_path, get_tokenizer()).sorted_items(top)
+
+
+def measure(
+    ranking: Callable[[str, Optional[int]], T], file_path: str, top: Optional[int]
+) -> Tuple[int, float, T]:
+    """Return peak traced bytes through the ranked output, untraced seconds and the rows."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        ranking(file_path, top)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        rows = ranking(file_path, top)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak, elapsed, rows
+
+
+def main() -> int:
+    """Report peak memory and time of both approaches for full and top-K rankings."""
+    failures = 0
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus_path = os.path.join(temp_dir, "corpus.txt")
+        build_corpus(corpus_path)
+        print(f"TOKENS\t{TOTAL_TOKENS}")
+        print(f"DISTINCT_WORDS\t{DISTINCT_WORDS}")
+        print(
+            "RANKING\tDICT_PEAK_MB\tCOMPACT_PEAK_MB\tREDUCTION\t"
+            "DICT_SECONDS\tCOMPACT_SECONDS\tSAME_OUTPUT"
+        )
+        for label, top in (("all", None), (f"top-{TOP_K}", TOP_K)):
+            dict_peak, dict_seconds, dict_rows = measure(dict_ranking, corpus_path, top)
+            compact_peak, compact_seconds, compact_rows = measure(compact_ranking, corpus_path, top)
+            same_output = dict_rows == compact_rows
+            print(
+                f"{label}\t{dict_peak / 2 ** 20:.2f}\t{compact_peak / 2 ** 20:.2f}\t"
+                f"{dict_peak / compact_peak:.2f}x\t{dict_seconds:.3f}\t{compact_seconds:.3f}\t"
+                f"{same_output}"
+            )
+            failures += not same_output or compact_peak >= dict_peak
+    if failures:
+        print("Compact counter did not reduce memory with equal output.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Check which tokens every tokenizer mode accepts as words."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import List, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+SOURCE_DIR = os.path.join(ROOT_DIR, "source")
+
+sys.path.insert(0, SOURCE_DIR)
+
+# pylint: disable=wrong-import-position
+from tokenizers import TOKENIZERS  # noqa: E402
+
+UNICODE_MODES = ("unicode", "casefold", "strip-punct")
+
+# (token, valid in ascii mode, valid in the Unicode modes)
+CASES: List[Tuple[str, bool, bool]] = [
+    ("hello", True, True),
+    ("café", False, True),
+    ("Straße", False, True),
+    ("हिन्दी", False, True),
+    ("cafe\u0301", False, True),
+    ("一二", False, True),
+    ("²", False, False),
+    ("½", False, False),
+    ("Ⅻ", False, False),
+    ("x²", False, False),
+    ("a²b", False, False),
+    ("42", False, False),
+    ("x_y", False, False),
+    ("\u0301a", False, False),
+]
+
+
+def check_mode(mode: str) -> List[str]:
+    """Return failure descriptions for one tokenizer mode."""
+    tokenizer = TOKENIZERS[mode]
+    failures: List[str] = []
+    for token, ascii_valid, unicode_valid in CASES:
+        expected = unicode_valid if mode in UNICODE_MODES else ascii_valid
+        words, _ = tokenizer.tokenize(token + "\n")
+        per_token = tokenizer.is_word(token)
+        chunk = tokenizer.clean_chunk_words(token + "\n") is not None
+        if per_token != expected or bool(words) != expected:
+            failures.append(f"{mode}\t{token!r}\texpected valid={expected}")
+        if chunk and not expected:
+            failures.append(f"{mode}\t{token!r}\tchunk fast path accepted an invalid word")
+    return failures
+
+
+def main() -> int:
+    """Run the token cases for every registered tokenizer."""
+    failures: List[str] = []
+    for mode in sorted(TOKENIZERS):
+        failures.extend(check_mode(mode))
+    for failure in failures:
+        print(failure)
+    print(f"FAILURES\t{len(failures)}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
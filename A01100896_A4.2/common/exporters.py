@@ -0,0 +1,199 @@
+"""Typed, batched result exporters shared by the three programs."""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import csv
+import json
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # pylint: disable=invalid-name
+
+BATCH_ROWS = 65_536
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+Column = Tuple[str, str]
+Row = Sequence[Any]
+
+COLUMN_TYPES = ("str", "int", "float")
+
+
+class Exporter(abc.ABC):
+    """Write rows of a fixed typed schema to a file, one batch at a time.
+
+    Columns are (name, type) pairs where type is "str", "int" or "float".
+    Any value may be None.
+    """
+
+    def __init__(self, path: str, columns: Sequence[Column]) -> None:
+        for name, column_type in columns:
+            if column_type not in COLUMN_TYPES:
+                raise ValueError(f"unsupported type '{column_type}' for column '{name}'")
+        self.path = path
+        self.columns = list(columns)
+        self.names = [name for name, _ in columns]
+        self.rows_written = 0
+
+    @abc.abstractmethod
+    def write_batch(self, rows: List[Row]) -> None:
+        """Write one batch of rows."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Flush and close the output file."""
+
+    def __enter__(self) -> "Exporter":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *exc_info: object) -> None:
+        self.close()
+        if exc_type is not None:
+            # Never leave a truncated file behind that looks like a finished export.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+
+
+class CsvExporter(Exporter):
+    """Comma-separated values with a header row; None becomes an empty field."""
+
+    def __init__(self, path: str, columns: Sequence[Column]) -> None:
+        super().__init__(path, columns)
+        # pylint: disable-next=consider-using-with
+        self._handle = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(self.names)
+
+    def write_batch(self, rows: List[Row]) -> None:
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class JsonLinesExporter(Exporter):
+    """One JSON object per line keyed by column name.
+
+    JSON has no NaN or infinity, so non-finite floats are written as null.
+    """
+
+    def __init__(self, path: str, columns: Sequence[Column]) -> None:
+        super().__init__(path, columns)
+        # pylint: disable-next=consider-using-with
+        self._handle = open(path, "w", encoding="utf-8")
+        self._float_columns = [
+            index for index, (_, column_type) in enumerate(columns) if column_type == "float"
+        ]
+
+    def _json_values(self, row: Row) -> List[Any]:
+        values = list(row)
+        for index in self._float_columns:
+            value = values[index]
+            if value is not None and not math.isfinite(value):
+                values[index] = None
+        return values
+
+    def write_batch(self, rows: List[Row]) -> None:
+        lines = [
+            json.dumps(
+                dict(zip(self.names, self._json_values(row))), ensure_ascii=False, allow_nan=False
+            ) + "\n"
+            for row in rows
+        ]
+        self._handle.writelines(lines)
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class ParquetExporter(Exporter):
+    """Apache Parquet file with one row group per batch; requires pyarrow.
+
+    Int columns are int64; values outside that range are written as null.
+    """
+
+    ARROW_TYPES = {"str": "string", "int": "int64", "float": "float64"}
+
+    def __init__(self, path: str, columns: Sequence[Column]) -> None:
+        if pyarrow is None:
+            raise ValueError("Parquet export requires the optional 'pyarrow' package")
+        super().__init__(path, columns)
+        self._schema = pyarrow.schema(
+            [(name, self.ARROW_TYPES[column_type]) for name, column_type in columns]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._int_columns = [
+            index for index, (_, column_type) in enumerate(columns) if column_type == "int"
+        ]
+
+    def _null_out_of_range(self, name: str, values: List[Any]) -> None:
+        """Replace ints outside int64 with null, reporting each one on the console."""
+        for offset, value in enumerate(values):
+            if value is not None and not INT64_MIN <= value <= INT64_MAX:
+                row_no = self.rows_written + offset + 1
+                print(f"Row {row_no}: {name} {value} is out of int64 range; written as null")
+                values[offset] = None
+
+    def write_batch(self, rows: List[Row]) -> None:
+        arrays = [list(column) for column in zip(*rows)] if rows else [[] for _ in self.names]
+        for index in self._int_columns:
+            self._null_out_of_range(self.names[index], arrays[index])
+        try:
+            table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+            self._writer.write_table(table)
+        except (pyarrow.ArrowException, OverflowError) as error:
+            raise ValueError(f"cannot write '{self.path}' as Parquet: {error}") from None
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+EXPORTERS: Dict[str, Type[Exporter]] = {
+    ".csv": CsvExporter,
+    ".jsonl": JsonLinesExporter,
+    ".parquet": ParquetExporter,
+}
+
+
+def open_exporter(path: str, columns: Sequence[Column]) -> Exporter:
+    """Open the exporter matching the output file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    exporter_class: Optional[Type[Exporter]] = EXPORTERS.get(extension)
+    if exporter_class is None:
+        names = ", ".join(sorted(EXPORTERS))
+        raise ValueError(f"unknown export format '{extension}' (choose from {names})")
+    return exporter_class(path, columns)
+
+
+def export_rows(
+    path: str,
+    columns: Sequence[Column],
+    rows: Iterable[Row],
+    batch_rows: int = BATCH_ROWS,
+) -> int:
+    """Stream rows to a file in batches of ``batch_rows``; return rows written."""
+    with open_exporter(path, columns) as exporter:
+        batch: List[Row] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                exporter.write_batch(batch)
+                batch = []
+        if batch or not exporter.rows_written:
+            exporter.write_batch(batch)
+        return exporter.rows_written
+
+
+def render_export_summary(path: str, rows_written: int, elapsed: float) -> str:
+    """Render the console summary printed instead of the text report."""
+    return f"EXPORTED\t{path}\t{rows_written}\nELAPSED_SECONDS\t{elapsed:.6f}"
@@ -0,0 +1,18 @@
+"""Command line option parsing shared by the three programs."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+
+def parse_options(argv: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Split arguments into positional values and --name=value options."""
+    positional: List[str] = []
+    options: Dict[str, str] = {}
+    for arg in argv:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value
+        else:
+            positional.append(arg)
+    return positional, options
@@ -0,0 +1,198 @@
+"""On-disk report cache keyed by input content, program version and options."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+HASH_BLOCK_BYTES = 1 << 20
+ENTRY_SUFFIX = ".report"
+STATS_FILE = "stats.json"
+CACHE_OPTIONS = ("cache", "cache-max-bytes", "cache-stats")
+
+
+class ResultCache:
+    """Directory of cached reports with size-bounded LRU eviction.
+
+    Each entry is one file named after its key. Reading an entry refreshes its
+    modification time, and the least recently used entries are removed once
+    the directory holds more than ``max_bytes`` of reports.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        program: str,
+        version: str,
+        file_paths: Sequence[str],
+        options: Dict[str, str],
+        extra: Sequence[str] = (),
+    ) -> str:
+        """Hash input contents with everything else that shapes the report."""
+        digest = hashlib.blake2b(digest_size=20)
+        settings = {name: value for name, value in options.items() if name not in CACHE_OPTIONS}
+        header = [program, version, json.dumps(settings, sort_keys=True), *extra]
+        digest.update(json.dumps(header).encode("utf-8"))
+        for file_path in file_paths:
+            digest.update(f"\0{os.path.getsize(file_path)}\0".encode("ascii"))
+            with open(file_path, "rb") as file_handle:
+                block = file_handle.read(HASH_BLOCK_BYTES)
+                while block:
+                    digest.update(block)
+                    block = file_handle.read(HASH_BLOCK_BYTES)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached report for a key, or None, and record the lookup."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file_handle:
+                report: Optional[str] = file_handle.read()
+            os.utime(path)
+        except FileNotFoundError:
+            report = None
+        self._record(hit=report is not None)
+        return report
+
+    def put(self, key: str, report: str) -> None:
+        """Store a report atomically, then evict entries over the size limit."""
+        self._write_atomic(self._entry_path(key), report)
+        self.evict()
+
+    def _write_atomic(self, path: str, text: str) -> None:
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as file_handle:
+            file_handle.write(text)
+        os.replace(temp_path, path)
+
+    def entries(self) -> List[os.DirEntry]:
+        """Return cache entries ordered from least to most recently used.
+
+        Entries removed by another process while scanning are skipped. Each
+        returned entry has its stat() result cached, so later size and time
+        reads do not touch the file again.
+        """
+        found: List[os.DirEntry] = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append(entry)
+        return sorted(found, key=lambda entry: entry.stat().st_mtime)
+
+    def evict(self) -> int:
+        """Remove least recently used entries above max_bytes; return removed count."""
+        entries = self.entries()
+        total = sum(entry.stat().st_size for entry in entries)
+        removed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue  # already evicted by another process
+            removed += 1
+        return removed
+
+    def _stats_path(self) -> str:
+        return os.path.join(self.directory, STATS_FILE)
+
+    def load_stats(self) -> Dict[str, int]:
+        """Return lifetime hit and miss counters."""
+        try:
+            with open(self._stats_path(), "r", encoding="utf-8") as file_handle:
+                return json.load(file_handle)
+        except (FileNotFoundError, ValueError):
+            return {"hits": 0, "misses": 0}
+
+    def _record(self, hit: bool) -> None:
+        stats = self.load_stats()
+        stats["hits" if hit else "misses"] += 1
+        self._write_atomic(self._stats_path(), json.dumps(stats))
+
+    def render_stats(self) -> str:
+        """Render hit rate and size lines for the console."""
+        stats = self.load_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups if lookups else 0.0
+        entries = self.entries()
+        lines = [
+            f"CACHE_HITS\t{stats['hits']}",
+            f"CACHE_MISSES\t{stats['misses']}",
+            f"CACHE_HIT_RATE\t{hit_rate:.4f}",
+            f"CACHE_ENTRIES\t{len(entries)}",
+            f"CACHE_BYTES\t{sum(entry.stat().st_size for entry in entries)}",
+        ]
+        return "\n".join(lines)
+
+
+def open_cache(options: Dict[str, str]) -> Optional[ResultCache]:
+    """Return the cache selected with --cache=DIR, or None when disabled."""
+    directory = options.get("cache")
+    if not directory:
+        return None
+    return ResultCache(directory, int(options.get("cache-max-bytes", DEFAULT_MAX_BYTES)))
+
+
+def run_cached(
+    cache: Optional[ResultCache],
+    key: Callable[[], str],
+    compute: Callable[[], str],
+) -> str:
+    """Return a cached report or compute and store one.
+
+    ``compute`` returns the full output ending with its ELAPSED_SECONDS line.
+    Only the lines before it are cached, together with the console
+    diagnostics ``compute`` printed, which a hit prints again. On a hit the
+    last line reports the lookup time and is marked CACHE_HIT.
+    """
+    if cache is None:
+        return compute()
+    start = time.perf_counter()
+    cache_key = key()
+    entry = load_entry(cache.get(cache_key))
+    if entry is not None:
+        console, report = entry
+        sys.stdout.write(console)
+        elapsed = time.perf_counter() - start
+        return f"{report}ELAPSED_SECONDS\t{elapsed:.6f}\tCACHE_HIT"
+    console_buffer = io.StringIO()
+    with contextlib.redirect_stdout(console_buffer):
+        output = compute()
+    console = console_buffer.getvalue()
+    sys.stdout.write(console)
+    report = output[:output.rfind("\n") + 1]
+    cache.put(cache_key, json.dumps({"console": console, "report": report}))
+    return output
+
+
+def load_entry(text: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Return (console, report) from a stored entry, or None if missing or unreadable."""
+    if text is None:
+        return None
+    try:
+        entry = json.loads(text)
+        return entry["console"], entry["report"]
+    except (ValueError, KeyError, TypeError):
+        return None
@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""Fuzz every optimized path against the reference implementations and time both."""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import math
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPT_DIR)
+COMMON_DIR = os.path.join(ROOT_DIR, "common")
+SOURCE_DIRS = [
+    os.path.join(ROOT_DIR, "P1_Compute_Statistics", "source"),
+    os.path.join(ROOT_DIR, "P2_Converter", "source"),
+    os.path.join(ROOT_DIR, "P3_Count_Words", "source"),
+]
+
+sys.path[:0] = SOURCE_DIRS + [COMMON_DIR]
+
+# pylint: disable=wrong-import-position
+import computeStatistics  # noqa: E402
+import convertNumbers  # noqa: E402
+import tokenizers  # noqa: E402
+import wordCount  # noqa: E402
+from compact_counts import count_file_compact  # noqa: E402
+from ngrams import NgramPipeline, run_pipeline  # noqa: E402
+from options import parse_options  # noqa: E402
+from result_cache import ResultCache, run_cached  # noqa: E402
+from word_index import ingest_file, open_index, query_top  # noqa: E402
+
+DEFAULT_SEED = 2026
+DEFAULT_CASES = 20
+DEFAULT_SCALE = 2000
+FLOAT_TOLERANCE = 1e-9
+ABS_TOLERANCE = 1e-6
+HEX_MASK = (1 << 40) - 1
+BIN_MASK = (1 << 10) - 1
+
+T = TypeVar("T")
+
+WORD_POOL = [
+    "the", "cat", "Sat", "ON", "mat", "regulatory", "pin", "sure", "mother",
+    "café", "naïve", "Straße", "hello,", "world!", "x1", "42", "a-b", "—", "_",
+    "हिन्दी", "नमस्ते", "cafe\u0301", "ΣΊΣΥΦΟΣ", "一二", "(naïve)", "¿qué?", "'quoted'",
+    "²", "½", "Ⅻ", "x²", "a²b", "٣", "\u0301a",
+]
+
+
+class Mismatch(Exception):
+    """Raised when an optimized path disagrees with the reference."""
+
+
+class Timer:
+    """Accumulate reference and candidate wall time for one check."""
+
+    def __init__(self) -> None:
+        self.reference = 0.0
+        self.candidate = 0.0
+
+    def reference_call(self, func: Callable[[], T]) -> T:
+        """Run the reference implementation with console output muted."""
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        self.reference += time.perf_counter() - start
+        return result
+
+    def candidate_call(self, func: Callable[[], T]) -> T:
+        """Run the optimized implementation with console output muted."""
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        self.candidate += time.perf_counter() - start
+        return result
+
+
+def capture(func: Callable[[], T]) -> Tuple[T, str]:
+    """Run a function and return its result with everything it printed."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func()
+    return result, output.getvalue()
+
+
+def expect_equal(what: str, expected: object, actual: object) -> None:
+    """Raise Mismatch with a short description when values differ."""
+    if expected != actual:
+        raise Mismatch(f"{what}: expected {str(expected)[:200]!r}, got {str(actual)[:200]!r}")
+
+
+def expect_close(what: str, expected: Optional[float], actual: Optional[float]) -> None:
+    """Raise Mismatch when floats differ beyond the harness tolerances."""
+    if expected is None or actual is None:
+        expect_equal(what, expected, actual)
+        return
+    if not math.isclose(expected, actual, rel_tol=FLOAT_TOLERANCE, abs_tol=ABS_TOLERANCE):
+        raise Mismatch(f"{what}: expected {expected!r}, got {actual!r}")
+
+
+def write_text(rng: random.Random, path: str, lines: List[str]) -> str:
+    """Write lines to a file, sometimes without a trailing newline."""
+    text = "\n".join(lines)
+    if lines and rng.random() < 0.5:
+        text += "\n"
+    with open(path, "w", encoding="utf-8") as file_handle:
+        file_handle.write(text)
+    return path
+
+
+def random_number_lines(rng: random.Random, scale: int) -> List[str]:
+    """Numbers with repeats, negatives, floats, blanks and invalid entries."""
+    lines: List[str] = []
+    for _ in range(rng.randint(1, scale)):
+        roll = rng.random()
+        if roll < 0.03:
+            lines.append("")
+        elif roll < 0.06:
+            lines.append(rng.choice(["abc", "1.2.3", "ERR", "--5"]))
+        elif roll < 0.5:
+            lines.append(str(rng.randint(-512, 1000)))
+        else:
+            lines.append(f"{rng.uniform(-1e6, 1e6):.4f}")
+    return lines
+
+
+def random_word_lines(rng: random.Random, scale: int) -> List[str]:
+    """Word lines mixing valid ASCII, Unicode, punctuation and blank lines."""
+    vocabulary = WORD_POOL + [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(1, 8)))
+        for _ in range(max(1, scale // 10))
+    ]
+    lines: List[str] = []
+    remaining = rng.randint(1, scale)
+    while remaining > 0:
+        if rng.random() < 0.03:
+            lines.append(rng.choice(["", "   ", "\t"]))
+            continue
+        width = min(remaining, rng.randint(1, 6))
+        remaining -= width
+        lines.append(" ".join(rng.choice(vocabulary) for _ in range(width)))
+    return lines
+
+
+def reference_parse_words(file_path: str, mode: str = tokenizers.DEFAULT_MODE) -> List[str]:
+    """Parse words token by token, without any chunk-level fast path.
+
+    The ASCII mode checks tokens exactly as the original per-character
+    wordCount did; the Unicode modes use the character-level is_unicode_word.
+    """
+    return [word for run in reference_word_runs(file_path, mode) for word in run]
+
+
+def reference_word_runs(file_path: str, mode: str = tokenizers.DEFAULT_MODE) -> List[List[str]]:
+    """Runs of consecutive valid words, split at invalid tokens and empty lines."""
+    tokenizer = tokenizers.get_tokenizer(mode)
+    is_valid = wordCount.is_alpha_word if mode == "ascii" else tokenizers.is_unicode_word
+    runs: List[List[str]] = [[]]
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        for line_no, raw_line in enumerate(file_handle, start=1):
+            line = raw_line.strip()
+            if not line:
+                print(f"Line {line_no}: empty line skipped")
+                runs.append([])
+                continue
+            for token in line.split():
+                word = tokenizers.strip_punctuation(token) if tokenizer.strip_punct else token
+                if not is_valid(word):
+                    print(f"Line {line_no}: invalid value '{token}'")
+                    runs.append([])
+                    continue
+                runs[-1].append(word.casefold() if tokenizer.casefold else word)
+    return runs
+
+
+def reference_ngrams(
+    file_path: str, order: int, mode: str = tokenizers.DEFAULT_MODE
+) -> List[str]:
+    """Consecutive words of one order that span no invalid token and no empty line."""
+    return [
+        " ".join(run[index:index + order])
+        for run in reference_word_runs(file_path, mode)
+        for index in range(len(run) - order + 1)
+    ]
+
+
+def reference_pairs(file_path: str, window: int, mode: str = tokenizers.DEFAULT_MODE) -> List[str]:
+    """Unordered word pairs at most window - 1 positions apart within a run."""
+    pairs: List[str] = []
+    for run in reference_word_runs(file_path, mode):
+        for index, word in enumerate(run):
+            for other in run[index + 1:index + window]:
+                pairs.append(" ".join(sorted((word, other))))
+    return pairs
+
+
+def strip_elapsed(report: str) -> str:
+    """Drop the trailing ELAPSED_SECONDS line from a report."""
+    return report[:report.rfind("\n")]
+
+
+def check_statistics_stdlib(rng: random.Random, scale: int, work_dir: str) -> None:
+    """compute_statistics against the statistics module."""
+    path = write_text(rng, os.path.join(work_dir, "numbers.txt"), random_number_lines(rng, scale))
+    with contextlib.redirect_stdout(io.StringIO()):
+        values = computeStatistics.parse_numbers(path)
+    if not values:
+        return
+    stats = computeStatistics.compute_statistics(values)
+    mean = statistics.fmean(values)
+    variance = statistics.pvariance(values)
+    median = statistics.median(values)
+    modes = statistics.multimode(values)
+    expect_equal("count", float(len(values)), stats["count"])
+    expect_close("mean", mean, stats["mean"])
+    expect_close("median", median, stats["median"])
+    expect_close("variance", variance, stats["variance"])
+    expect_close("sd", math.sqrt(variance), stats["sd"])
+    repeated = values.count(modes[0]) > 1
+    expect_equal("mode", sorted(modes) if repeated else None, stats["mode"])
+
+
+def check_statistics_cache(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """computeStatistics report served from the result cache."""
+    path = write_text(rng, os.path.join(work_dir, "numbers.txt"), random_number_lines(rng, scale))
+    check_cache_hit(
+        timer,
+        work_dir,
+        lambda: ResultCache.make_key("computeStatistics", "fuzz", [path], {}),
+        lambda: computeStatistics.compute_report(path),
+    )
+
+
+def check_convert_format(rng: random.Random, scale: int, work_dir: str) -> None:
+    """convert_value against builtin formatting with two's complement masks."""
+    del work_dir
+    values = [rng.randint(-512, 1 << 40) for _ in range(scale)]
+    values += [0, -1, -512, 1, 1 << 39]
+    expected = [format_conversion(value) for value in values]
+    actual = [convertNumbers.convert_value(value) for value in values]
+    expect_equal("conversions", expected, actual)
+
+
+def format_conversion(value: int) -> Tuple[str, str]:
+    """Convert with format(); negatives use 10-bit binary and 40-bit hex."""
+    if value >= 0:
+        return format(value, "b"), format(value, "X")
+    return format(value & BIN_MASK, "010b"), format(value & HEX_MASK, "010X")
+
+
+def check_convert_export(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Streaming CSV export of conversions against the text report."""
+    lines = [
+        str(rng.randint(-512, 10 ** 6)) if rng.random() > 0.05 else rng.choice(["", "ABC"])
+        for _ in range(rng.randint(1, scale))
+    ]
+    path = write_text(rng, os.path.join(work_dir, "ints.txt"), lines)
+    export_path = os.path.join(work_dir, "ints.csv")
+    report = timer.reference_call(
+        lambda: convertNumbers.render_results(convertNumbers.parse_numbers(path), 0.0, "INPUT")
+    )
+    timer.candidate_call(lambda: convertNumbers.export_file(path, export_path))
+    expected = [line.split("\t") for line in report.split("\n")[1:-1]]
+    with open(export_path, "r", encoding="utf-8", newline="") as file_handle:
+        rows = list(csv.reader(file_handle))[1:]
+    actual = [
+        [item, text, binary or "#VALUE!", hexadecimal or "#VALUE!"]
+        for item, text, _, binary, hexadecimal in rows
+    ]
+    expect_equal("exported rows", expected, actual)
+
+
+def check_convert_cache(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """convertNumbers report served from the result cache."""
+    lines = [str(rng.randint(-512, 10 ** 6)) for _ in range(rng.randint(1, scale))]
+    path = write_text(rng, os.path.join(work_dir, "ints.txt"), lines)
+    check_cache_hit(
+        timer,
+        work_dir,
+        lambda: ResultCache.make_key("convertNumbers", "fuzz", [path], {}),
+        lambda: convertNumbers.compute_report(path),
+    )
+
+
+def reference_counts(timer: Timer, path: str, mode: str) -> Dict[str, int]:
+    """Count words of a file with the per-token reference parser and count_words."""
+    return timer.reference_call(lambda: wordCount.count_words(reference_parse_words(path, mode)))
+
+
+def check_words_chunked(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Chunked tokenizer parsing, including console messages, against the original parser."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    compare_chunked_parse(rng, path, tokenizers.DEFAULT_MODE, timer)
+
+
+def check_words_unicode_chunks(
+    rng: random.Random, scale: int, work_dir: str, timer: Timer
+) -> None:
+    """unicode, casefold and strip-punct chunk parsing against the per-token reference."""
+    lines = random_word_lines(rng, scale)
+    if rng.random() < 0.5:
+        # Only valid words, so whole chunks take the clean-chunk fast path.
+        valid = [word for word in WORD_POOL if tokenizers.is_unicode_word(word)]
+        lines = [" ".join(rng.choices(valid, k=rng.randint(1, 6))) for _ in lines]
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), lines)
+    tokenizers.word_patterns(True)  # build the Unicode classes once, outside the timings
+    for mode in ("unicode", "casefold", "strip-punct"):
+        compare_chunked_parse(rng, path, mode, timer)
+
+
+def compare_chunked_parse(rng: random.Random, path: str, mode: str, timer: Timer) -> None:
+    """parse_words with a random chunk size against reference_parse_words for one mode."""
+    expected_out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(expected_out):
+        expected = reference_parse_words(path, mode)
+    timer.reference += time.perf_counter() - start
+
+    saved_hint = tokenizers.CHUNK_SIZE_HINT
+    tokenizers.CHUNK_SIZE_HINT = rng.choice([1, 64, 4096, saved_hint])
+    actual_out = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(actual_out):
+            actual = wordCount.parse_words(path, tokenizers.get_tokenizer(mode))
+    finally:
+        tokenizers.CHUNK_SIZE_HINT = saved_hint
+    timer.candidate += time.perf_counter() - start
+    expect_equal(f"{mode} words", expected, actual)
+    expect_equal(f"{mode} messages", expected_out.getvalue(), actual_out.getvalue())
+
+
+def check_words_compact(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Streaming CompactCounter against count_words and sort_counts in every tokenizer mode."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    for mode in tokenizers.TOKENIZERS:
+        compare_compact_counts(rng, path, mode, timer)
+
+
+def compare_compact_counts(rng: random.Random, path: str, mode: str, timer: Timer) -> None:
+    """Full and top-K CompactCounter rankings against sort_counts for one mode."""
+    expected = wordCount.sort_counts(reference_counts(timer, path, mode))
+    tokenizer = tokenizers.get_tokenizer(mode)
+    counter = timer.candidate_call(lambda: count_file_compact(path, tokenizer))
+    expect_equal(f"{mode} ranked counts", expected, timer.candidate_call(counter.sorted_items))
+    top = rng.randint(0, len(expected) + 1)
+    actual_top = timer.candidate_call(lambda: counter.sorted_items(top))
+    expect_equal(f"{mode} top counts", expected[:top], actual_top)
+
+
+def check_words_index(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Incremental SQLite index over appended pieces against one full count, per mode.
+
+    Pieces are cut at arbitrary byte positions, so runs see unterminated last
+    lines and split multi-byte characters that must be left for the next run.
+    """
+    lines = random_word_lines(rng, scale)
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), lines)
+    with open(path, "rb") as file_handle:
+        data = file_handle.read()
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    cuts = sorted(rng.sample(range(len(data) + 1), min(4, len(data) + 1)))
+    pieces = [data[start:end] for start, end in zip([0] + cuts, cuts + [len(data)])]
+    for mode in tokenizers.TOKENIZERS:
+        compare_indexed_counts(path, pieces, mode, timer)
+
+
+def compare_indexed_counts(path: str, pieces: List[bytes], mode: str, timer: Timer) -> None:
+    """Index a copy of a file grown from pieces and compare it with a full count for one mode."""
+    work_dir = os.path.dirname(path)
+    data = b"".join(pieces)
+    expected = wordCount.sort_counts(reference_counts(timer, path, mode))
+    conn = open_index(os.path.join(work_dir, f"words-{mode}.db"), mode)
+    try:
+        growing = os.path.join(work_dir, f"growing-{mode}.txt")
+        ingest_in_pieces(conn, growing, pieces, mode, timer)
+        actual = timer.candidate_call(lambda: list(query_top(conn)))
+        source = conn.execute("SELECT byte_offset, line_no FROM sources").fetchone()
+    finally:
+        conn.close()
+    expect_equal(f"{mode} indexed counts", expected, actual)
+    expect_equal(f"{mode} indexed offset and line", (len(data), data.count(b"\n")), source)
+
+
+def ingest_in_pieces(
+    conn: sqlite3.Connection, path: str, pieces: List[bytes], mode: str, timer: Timer
+) -> None:
+    """Grow a file piece by piece, ingesting after each append."""
+    tokenizer = tokenizers.get_tokenizer(mode)
+    with open(path, "wb"):
+        pass
+    for piece in pieces:
+        with open(path, "ab") as file_handle:
+            file_handle.write(piece)
+        timer.candidate_call(lambda: ingest_file(conn, path, tokenizer))
+
+
+def check_words_ngrams(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Exact n-gram pipeline against naive run-aware n-gram counts in every tokenizer mode."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    for mode in tokenizers.TOKENIZERS:
+        compare_ngram_counts(path, (1, 2, 3), mode, timer)
+
+
+def compare_ngram_counts(path: str, orders: Tuple[int, ...], mode: str, timer: Timer) -> None:
+    """NgramPipeline counts of several orders against reference_ngrams for one mode."""
+    expected = timer.reference_call(
+        lambda: [wordCount.count_words(reference_ngrams(path, order, mode)) for order in orders]
+    )
+    tokenizer = tokenizers.get_tokenizer(mode)
+    pipeline = timer.candidate_call(lambda: run_pipeline(path, tokenizer, NgramPipeline(orders)))
+    for order, counts in zip(orders, expected):
+        expect_equal(f"{mode} order {order}", counts, pipeline.ngram_counts(order))
+
+
+def check_words_cooccurrence(
+    rng: random.Random, scale: int, work_dir: str, timer: Timer
+) -> None:
+    """Exact co-occurrence counts against naive run-aware pairs in every tokenizer mode."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    window = rng.randint(2, 6)
+    for mode in tokenizers.TOKENIZERS:
+        compare_pair_counts(path, window, mode, timer)
+
+
+def compare_pair_counts(path: str, window: int, mode: str, timer: Timer) -> None:
+    """Exact NgramPipeline co-occurrences against reference_pairs for one mode."""
+    expected = timer.reference_call(
+        lambda: wordCount.count_words(reference_pairs(path, window, mode))
+    )
+    tokenizer = tokenizers.get_tokenizer(mode)
+    pipeline = timer.candidate_call(
+        lambda: run_pipeline(path, tokenizer, NgramPipeline((1,), window=window))
+    )
+    expect_equal(f"{mode} pairs", expected, pipeline.cooccurrence_counts())
+
+
+def check_words_sketch(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """Count-min bigram estimates never undercount and stay within the error bound."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    pairs = timer.reference_call(lambda: reference_ngrams(path, 2))
+    exact = timer.reference_call(lambda: wordCount.count_words(pairs))
+    width = rng.choice([64, 256, 1024])
+    pipeline = timer.candidate_call(
+        lambda: run_pipeline(
+            path, tokenizers.get_tokenizer(), NgramPipeline((2,), sketch_width=width)
+        )
+    )
+    expect_sketch_bound("bigram", exact, pipeline.ngram_counts(2), len(pairs), width)
+
+
+def check_words_sketch_cooccurrence(
+    rng: random.Random, scale: int, work_dir: str, timer: Timer
+) -> None:
+    """Count-min co-occurrence estimates never undercount and stay within the error bound."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    window = rng.randint(2, 6)
+    pairs = timer.reference_call(lambda: reference_pairs(path, window))
+    exact = timer.reference_call(lambda: wordCount.count_words(pairs))
+    width = rng.choice([64, 256, 1024])
+    pipeline = timer.candidate_call(
+        lambda: run_pipeline(
+            path,
+            tokenizers.get_tokenizer(),
+            NgramPipeline((1,), window=window, sketch_width=width),
+        )
+    )
+    expect_sketch_bound("pair", exact, pipeline.cooccurrence_counts(), len(pairs), width)
+
+
+def expect_sketch_bound(
+    what: str, exact: Dict[str, int], estimates: Dict[str, int], total: int, width: int
+) -> None:
+    """Raise Mismatch when a sketch undercounts or its mean error exceeds e * N / width."""
+    errors = [estimates[key] - exact.get(key, 0) for key in estimates]
+    if any(error < 0 for error in errors):
+        raise Mismatch(f"sketch undercounted a {what}")
+    bound = math.e * total / width
+    if errors and sum(errors) / len(errors) > bound:
+        raise Mismatch(f"mean sketch error {sum(errors) / len(errors):.2f} exceeds {bound:.2f}")
+
+
+def check_words_cache(rng: random.Random, scale: int, work_dir: str, timer: Timer) -> None:
+    """wordCount report served from the result cache."""
+    path = write_text(rng, os.path.join(work_dir, "words.txt"), random_word_lines(rng, scale))
+    check_cache_hit(
+        timer,
+        work_dir,
+        lambda: ResultCache.make_key("wordCount", "fuzz", [path], {}),
+        lambda: wordCount.compute_report([path], {}),
+    )
+
+
+def check_cache_hit(
+    timer: Timer, work_dir: str, key: Callable[[], str], compute: Callable[[], str]
+) -> None:
+    """A cache hit must match a plain compute call, report and console output, minus timing."""
+    cache = ResultCache(os.path.join(work_dir, "cache"))
+
+    def cached() -> str:
+        return run_cached(cache, key, compute)
+
+    expected, expected_out = timer.reference_call(lambda: capture(compute))
+    with contextlib.redirect_stdout(io.StringIO()):
+        cached()
+    actual, actual_out = timer.candidate_call(lambda: capture(cached))
+    if not actual.endswith("\tCACHE_HIT"):
+        raise Mismatch("second run was not served from the cache")
+    expect_equal("cached report", strip_elapsed(expected), strip_elapsed(actual))
+    expect_equal("cached console output", expected_out, actual_out)
+
+
+# Repository code against an independent oracle; nothing is optimized, so nothing is timed.
+ORACLE_CHECKS: Dict[str, Callable[[random.Random, int, str], None]] = {
+    "statistics.stdlib": check_statistics_stdlib,
+    "convert.format": check_convert_format,
+}
+
+# Optimized or alternative paths against the reference implementation, timed.
+CHECKS: Dict[str, Callable[[random.Random, int, str, Timer], None]] = {
+    "statistics.cache": check_statistics_cache,
+    "convert.export_stream": check_convert_export,
+    "convert.cache": check_convert_cache,
+    "words.chunked_tokenizer": check_words_chunked,
+    "words.unicode_chunks": check_words_unicode_chunks,
+    "words.compact_counter": check_words_compact,
+    "words.incremental_index": check_words_index,
+    "words.ngram_pipeline": check_words_ngrams,
+    "words.cooccurrence": check_words_cooccurrence,
+    "words.count_min_sketch": check_words_sketch,
+    "words.sketch_cooccurrence": check_words_sketch_cooccurrence,
+    "words.cache": check_words_cache,
+}
+
+
+def run_cases(
+    name: str, seed: int, cases: int, case: Callable[[random.Random, str], None]
+) -> Optional[str]:
+    """Run one check over several random cases; return the first failure."""
+    for index in range(cases):
+        rng = random.Random(f"{seed}:{name}:{index}")
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                case(rng, work_dir)
+            except Mismatch as error:
+                return f"case {index}: {error}"
+    return None
+
+
+def run_check(
+    name: str, seed: int, cases: int, scale: int
+) -> Tuple[Timer, Optional[str]]:
+    """Run one timed check over several random cases; return timings and first failure."""
+    check = CHECKS[name]
+    timer = Timer()
+    failure = run_cases(name, seed, cases, lambda rng, work_dir: check(rng, scale, work_dir, timer))
+    return timer, failure
+
+
+def run_oracle_check(name: str, seed: int, cases: int, scale: int) -> Optional[str]:
+    """Run one oracle check over several random cases; return the first failure."""
+    check = ORACLE_CHECKS[name]
+    return run_cases(name, seed, cases, lambda rng, work_dir: check(rng, scale, work_dir))
+
+
+def render_status(failure: Optional[str]) -> str:
+    """Return PASS or FAIL with the failing case."""
+    return "PASS" if failure is None else f"FAIL {failure}"
+
+
+def main(argv: List[str]) -> int:
+    """Run every check and print a timing and status table."""
+    _, options = parse_options(argv[1:])
+    seed = int(options.get("seed", DEFAULT_SEED))
+    cases = int(options.get("cases", DEFAULT_CASES))
+    scale = int(options.get("scale", DEFAULT_SCALE))
+    only = options.get("only", "")
+
+    print(f"SEED\t{seed}\tCASES\t{cases}\tSCALE\t{scale}")
+    print("ORACLE_CHECK\tSTATUS")
+    failures = 0
+    for name in [name for name in ORACLE_CHECKS if name.startswith(only)]:
+        failure = run_oracle_check(name, seed, cases, scale)
+        failures += failure is not None
+        print(f"{name}\t{render_status(failure)}")
+    print("CHECK\tREF_SECONDS\tCANDIDATE_SECONDS\tSPEEDUP\tSTATUS")
+    for name in [name for name in CHECKS if name.startswith(only)]:
+        timer, failure = run_check(name, seed, cases, scale)
+        speedup = timer.reference / timer.candidate if timer.candidate else 0.0
+        failures += failure is not None
+        print(
+            f"{name}\t{timer.reference:.6f}\t{timer.candidate:.6f}\t"
+            f"{speedup:.2f}\t{render_status(failure)}"
+        )
+    print(f"FAILURES\t{failures}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))